@@ -1,3 +1,6 @@
+from functools import reduce
+from operator import mul
+
 import numpy as np
 
 
@@ -41,8 +44,20 @@ def guess_pyramid(data):
     if hasattr(data, 'ndim') and data.ndim > 1:
         return False
 
-    size = np.array([np.prod(d.shape, dtype=np.uint64) for d in data])
-    if len(size) > 1:
-        return bool(np.all(size[:-1] > size[1:]))
-    else:
+    # A pyramid needs at least two levels and a first level bigger than the
+    # last one, checking this first avoids visiting every level when the
+    # data clearly isn't a pyramid
+    if len(data) < 2:
+        return False
+    if reduce(mul, data[0].shape, 1) <= reduce(mul, data[-1].shape, 1):
         return False
+
+    # Python integers avoid the per-level np.prod call overhead, and are
+    # written straight into a single int64 buffer which is wide enough to
+    # avoid integer overflow with big data
+    size = np.fromiter(
+        (reduce(mul, d.shape, 1) for d in data),
+        dtype=np.int64,
+        count=len(data),
+    )
+    return bool(np.all(np.diff(size) < 0))
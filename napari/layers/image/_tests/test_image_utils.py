@@ -7,64 +7,80 @@ from napari.layers.image._image_utils import (
     guess_rgb,
 )
 
-
-data_dask = da.random.random(
-    size=(100_000, 1000, 1000), chunks=(1, 1000, 1000)
-)
+rng = np.random.default_rng(0)
 
 
-def test_guess_rgb():
-    shape = (10, 15)
-    assert not guess_rgb(shape)
-
-    shape = (10, 15, 6)
-    assert not guess_rgb(shape)
+@pytest.fixture(scope="module")
+def data_dask():
+    return da.zeros(
+        (100_000, 1000, 1000), chunks=(1, 1000, 1000), dtype=np.float64
+    )
 
-    shape = (10, 15, 3)
-    assert guess_rgb(shape)
 
-    shape = (10, 15, 4)
-    assert guess_rgb(shape)
+@pytest.fixture(scope="module")
+def gaussian_pyramid():
+    return tuple(pyramid_gaussian(rng.random((10, 15)), multichannel=False))
 
 
-def test_guess_pyramid():
-    data = np.random.random((10, 15))
-    assert not guess_pyramid(data)
+@pytest.mark.timeout(0.2)
+@pytest.mark.parametrize(
+    "shape, expected",
+    [
+        ((10, 15), False),
+        ((10, 15, 6), False),
+        ((10, 15, 3), True),
+        ((10, 15, 4), True),
+    ],
+)
+def test_guess_rgb(shape, expected):
+    assert guess_rgb(shape) == expected
 
-    data = np.random.random((10, 15, 6))
-    assert not guess_pyramid(data)
 
-    data = [np.random.random((10, 15, 6))]
+@pytest.mark.timeout(1)
+@pytest.mark.parametrize("shape", [(10, 15), (10, 15, 6)])
+def test_guess_pyramid_single_array(shape):
+    data = rng.random(shape)
     assert not guess_pyramid(data)
 
-    data = [np.random.random((10, 15, 6)), np.random.random((10, 15, 6))]
-    assert not guess_pyramid(data)
 
-    data = [np.random.random((10, 15, 6)), np.random.random((5, 7, 3))]
-    assert guess_pyramid(data)
+@pytest.mark.timeout(1)
+@pytest.mark.parametrize("container", [list, tuple])
+@pytest.mark.parametrize(
+    "shapes, expected",
+    [
+        ([(10, 15, 6)], False),
+        ([(10, 15, 6), (10, 15, 6)], False),
+        ([(10, 15, 6), (5, 7, 3)], True),
+        ([(10, 15, 6), (10, 7, 3)], True),
+        ([(10, 15, 6), (20, 15, 6), (5, 7, 3)], False),
+    ],
+)
+def test_guess_pyramid(shapes, expected, container):
+    data = container(rng.random(shape) for shape in shapes)
+    assert guess_pyramid(data) == expected
 
-    data = [np.random.random((10, 15, 6)), np.random.random((10, 7, 3))]
-    assert guess_pyramid(data)
 
-    data = tuple(data)
+@pytest.mark.timeout(1)
+def test_guess_pyramid_gaussian(gaussian_pyramid):
+    data = gaussian_pyramid
     assert guess_pyramid(data)
 
-    data = tuple(
-        pyramid_gaussian(np.random.random((10, 15)), multichannel=False)
-    )
+    data = np.asarray(gaussian_pyramid, dtype=object)
     assert guess_pyramid(data)
 
-    data = np.asarray(
-        tuple(pyramid_gaussian(np.random.random((10, 15)), multichannel=False))
-    )
-    assert guess_pyramid(data)
 
+@pytest.mark.timeout(1)
+def test_guess_pyramid_big_data():
     # Check for integer overflow with big data
     s = 8192
-    data = [da.ones((s,) * 3), da.ones((s // 2,) * 3), da.ones((s // 4,) * 3)]
+    data = [
+        da.empty((s,) * 3, chunks=s),
+        da.empty((s // 2,) * 3, chunks=s // 2),
+        da.empty((s // 4,) * 3, chunks=s // 4),
+    ]
     assert guess_pyramid(data)
 
 
 @pytest.mark.timeout(2)
-def test_timing_is_pyramid_big():
+def test_timing_is_pyramid_big(data_dask):
     assert not guess_pyramid(data_dask)
@@ -39,16 +39,20 @@ def points_to_squares(points, sizes):
     rect : (4N, 2) array
         Vertices of the expanded points
     """
-    rect = np.concatenate(
-        [
-            points + np.sqrt(2) / 2 * np.array([sizes, sizes]).T,
-            points + np.sqrt(2) / 2 * np.array([sizes, -sizes]).T,
-            points + np.sqrt(2) / 2 * np.array([-sizes, sizes]).T,
-            points + np.sqrt(2) / 2 * np.array([-sizes, -sizes]).T,
-        ],
-        axis=0,
-    )
-    return rect
+    points = np.asarray(points)
+    half_sizes = (np.sqrt(2) / 2 * np.asarray(sizes))[..., np.newaxis]
+
+    # Fill the corners in place into a single (4, N, 2) array. The (+, +) and
+    # (-, -) corners are computed directly and the two mixed corners take one
+    # coordinate from each of them.
+    rect = np.empty((4,) + np.broadcast(points, half_sizes).shape)
+    np.add(points, half_sizes, out=rect[0])
+    np.subtract(points, half_sizes, out=rect[3])
+    rect[1, :, 0] = rect[0, :, 0]
+    rect[1, :, 1] = rect[3, :, 1]
+    rect[2, :, 0] = rect[3, :, 0]
+    rect[2, :, 1] = rect[0, :, 1]
+    return rect.reshape(-1, 2)
 
 
 def points_in_box(corners, points, sizes):
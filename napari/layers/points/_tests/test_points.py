@@ -1,4 +1,4 @@
-from copy import copy
+from functools import lru_cache
 from itertools import cycle, islice
 from xml.etree.ElementTree import Element
 
@@ -8,7 +8,8 @@ import pytest
 from vispy.color import get_colormap
 
 from napari.layers import Points
-from napari.layers.points._points_utils import points_to_squares
+from napari.layers.points._points_utils import create_box, points_to_squares
+from napari.layers.utils.color_transformations import transform_color_cycle
 from napari.utils.colormaps.standardize_color import transform_color
 
 
@@ -25,12 +26,90 @@ def _make_cycled_properties(values, length):
     Returns:
     --------
     cycled_properties : np.ndarray
-        The property array comprising the cycled values.
+        The property array comprising the cycled values. The array is cached
+        and shared between calls so it is read-only, copy it before mutating.
     """
-    cycled_properties = np.array(list(islice(cycle(values), 0, length)))
+    return _cycled_properties(tuple(values), length)
+
+
+@lru_cache(maxsize=None)
+def _cycled_properties(values, length):
+    cycled_properties = np.resize(np.asarray(values), length)
+    cycled_properties.setflags(write=False)
     return cycled_properties
 
 
+def _transform_color(colors):
+    """Cached transform_color for the expected colors in these tests.
+
+    The returned array is shared between calls so it is read-only, copy it
+    before mutating.
+    """
+    if isinstance(colors, list):
+        colors = tuple(colors)
+    return _cached_transform_color(colors)
+
+
+@lru_cache(maxsize=None)
+def _cached_transform_color(colors):
+    # copy as transform_color may itself return a cached array
+    color_array = transform_color(colors).copy()
+    color_array.setflags(write=False)
+    return color_array
+
+
+def _read_only_random_points(shape):
+    """Make reproducible random point coordinates that can't be modified."""
+    data = 20 * np.random.default_rng(0).random(shape)
+    data.setflags(write=False)
+    return data
+
+
+@pytest.fixture(scope="session")
+def random_points_2d_10():
+    return _read_only_random_points((10, 2))
+
+
+@pytest.fixture(scope="session")
+def random_points_2d_20():
+    return _read_only_random_points((20, 2))
+
+
+@pytest.fixture(scope="session")
+def random_points_3d_10():
+    return _read_only_random_points((10, 3))
+
+
+@pytest.fixture(scope="session")
+def random_points_4d_10():
+    return _read_only_random_points((10, 4))
+
+
+@pytest.fixture(scope="module")
+def shared_layer(random_points_2d_10):
+    """Layer shared by the tests that only toggle its metadata.
+
+    Tests using it must restore any attribute they change.
+    """
+    return Points(random_points_2d_10)
+
+
+@pytest.fixture
+def make_points_layer(random_points_2d_10):
+    """Factory for layers built on the shared 2D random points."""
+
+    def _make_points_layer(**kwargs):
+        return Points(random_points_2d_10, **kwargs)
+
+    return _make_points_layer
+
+
+@pytest.fixture(params=['edge', 'face'])
+def attribute(request):
+    """Name of the colored point attribute, either 'edge' or 'face'."""
+    return request.param
+
+
 def test_empty_points():
     pts = Points()
     assert pts.data.shape == (0, 2)
@@ -43,21 +122,21 @@ def test_empty_points_with_properties():
     """
     properties = {
         'label': np.array(['label1', 'label2']),
-        'cont_prop': np.array([0], dtype=np.float),
+        'cont_prop': np.array([0], dtype=np.float64),
     }
     pts = Points(properties=properties)
     current_props = {k: v[0] for k, v in properties.items()}
     np.testing.assert_equal(pts.current_properties, current_props)
 
     # verify the property datatype is correct
-    assert pts.properties['cont_prop'].dtype == np.float
+    assert pts.properties['cont_prop'].dtype == np.float64
 
     # add two points and verify the default property was applied
     pts.add([10, 10])
     pts.add([20, 20])
     props = {
         'label': np.array(['label1', 'label1']),
-        'cont_prop': np.array([0, 0], dtype=np.float),
+        'cont_prop': np.array([0, 0], dtype=np.float64),
     }
     np.testing.assert_equal(pts.properties, props)
 
@@ -78,7 +157,7 @@ def test_empty_points_with_properties_list():
     pts.add([20, 20])
     props = {
         'label': np.array(['label1', 'label1']),
-        'cont_prop': np.array([0, 0], dtype=np.float),
+        'cont_prop': np.array([0, 0], dtype=np.float64),
     }
     np.testing.assert_equal(pts.properties, props)
 
@@ -87,7 +166,7 @@ def test_empty_layer_with_face_colorap():
     """ Test creating an empty layer where the face color is a colormap
     See: https://github.com/napari/napari/pull/1069
     """
-    default_properties = {'point_type': np.array([1.5], dtype=np.float)}
+    default_properties = {'point_type': np.array([1.5], dtype=np.float64)}
     layer = Points(
         properties=default_properties,
         face_color='point_type',
@@ -105,7 +184,7 @@ def test_empty_layer_with_edge_colormap():
     """ Test creating an empty layer where the face color is a colormap
     See: https://github.com/napari/napari/pull/1069
     """
-    default_properties = {'point_type': np.array([1.5], dtype=np.float)}
+    default_properties = {'point_type': np.array([1.5], dtype=np.float64)}
     layer = Points(
         properties=default_properties,
         edge_color='point_type',
@@ -119,11 +198,10 @@ def test_empty_layer_with_edge_colormap():
     assert np.all(layer._current_edge_color == edge_color)
 
 
-def test_random_points():
+def test_random_points(random_points_2d_10):
     """Test instantiating Points layer with random 2D data."""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_2d_10
     layer = Points(data)
     assert np.all(layer.data == data)
     assert layer.ndim == shape[1]
@@ -132,11 +210,10 @@ def test_random_points():
     assert len(layer.selected_data) == 0
 
 
-def test_integer_points():
+def test_integer_points(random_points_2d_10):
     """Test instantiating Points layer with integer data."""
     shape = (10, 2)
-    np.random.seed(0)
-    data = np.random.randint(20, size=(10, 2))
+    data = random_points_2d_10.astype(int)
     layer = Points(data)
     assert np.all(layer.data == data)
     assert layer.ndim == shape[1]
@@ -144,11 +221,10 @@ def test_integer_points():
     assert len(layer.data) == 10
 
 
-def test_negative_points():
+def test_negative_points(random_points_2d_10):
     """Test instantiating Points layer with negative data."""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape) - 10
+    data = random_points_2d_10 - 10
     layer = Points(data)
     assert np.all(layer.data == data)
     assert layer.ndim == shape[1]
@@ -167,11 +243,10 @@ def test_empty_points_array():
     assert len(layer.data) == 0
 
 
-def test_3D_points():
+def test_3D_points(random_points_3d_10):
     """Test instantiating Points layer with random 3D data."""
     shape = (10, 3)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_3d_10
     layer = Points(data)
     assert np.all(layer.data == data)
     assert layer.ndim == shape[1]
@@ -179,11 +254,10 @@ def test_3D_points():
     assert len(layer.data) == 10
 
 
-def test_4D_points():
+def test_4D_points(random_points_4d_10):
     """Test instantiating Points layer with random 4D data."""
     shape = (10, 4)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_4d_10
     layer = Points(data)
     assert np.all(layer.data == data)
     assert layer.ndim == shape[1]
@@ -191,13 +265,11 @@ def test_4D_points():
     assert len(layer.data) == 10
 
 
-def test_changing_points():
+def test_changing_points(random_points_2d_10, random_points_2d_20):
     """Test changing Points data."""
-    shape_a = (10, 2)
     shape_b = (20, 2)
-    np.random.seed(0)
-    data_a = 20 * np.random.random(shape_a)
-    data_b = 20 * np.random.random(shape_b)
+    data_a = random_points_2d_10
+    data_b = random_points_2d_20
     layer = Points(data_a)
     layer.data = data_b
     assert np.all(layer.data == data_b)
@@ -206,11 +278,9 @@ def test_changing_points():
     assert len(layer.data) == 20
 
 
-def test_selecting_points():
+def test_selecting_points(random_points_2d_10):
     """Test selecting points."""
-    shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_2d_10
     layer = Points(data)
     layer.mode = 'select'
     data_to_select = {1, 2}
@@ -241,11 +311,9 @@ def test_selecting_points():
     assert layer.selected_data == set()
 
 
-def test_adding_points():
+def test_adding_points(random_points_2d_10):
     """Test adding Points data."""
-    shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_2d_10
     layer = Points(data)
     assert len(layer.data) == 10
 
@@ -276,11 +344,10 @@ def test_adding_points_to_empty():
     assert np.all(layer.data[0] == coord)
 
 
-def test_removing_selected_points():
+def test_removing_selected_points(random_points_2d_10):
     """Test selecting points."""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_2d_10
     layer = Points(data)
 
     # With nothing selected no points should be removed
@@ -301,12 +368,10 @@ def test_removing_selected_points():
     assert len(layer.data) == shape[0] - 3
 
 
-def test_move():
+def test_move(random_points_2d_10):
     """Test moving points."""
-    shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    unmoved = copy(data)
+    unmoved = random_points_2d_10
+    data = unmoved.copy()
     layer = Points(data)
 
     # Move one point relative to an initial drag start location
@@ -322,108 +387,108 @@ def test_move():
     assert np.all(layer.data[1:2] == unmoved[1:2] + [-3, 4])
 
 
-def test_changing_modes():
+def test_changing_modes(shared_layer):
     """Test changing modes."""
-    shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    layer = Points(data)
+    layer = shared_layer
     assert layer.mode == 'pan_zoom'
     assert layer.interactive is True
 
-    layer.mode = 'add'
-    assert layer.mode == 'add'
-    assert layer.interactive is False
+    try:
+        layer.mode = 'add'
+        assert layer.mode == 'add'
+        assert layer.interactive is False
 
-    layer.mode = 'select'
-    assert layer.mode == 'select'
-    assert layer.interactive is False
+        layer.mode = 'select'
+        assert layer.mode == 'select'
+        assert layer.interactive is False
 
-    layer.mode = 'pan_zoom'
-    assert layer.mode == 'pan_zoom'
-    assert layer.interactive is True
+        layer.mode = 'pan_zoom'
+        assert layer.mode == 'pan_zoom'
+        assert layer.interactive is True
 
-    with pytest.raises(ValueError):
-        layer.mode = 'not_a_mode'
+        with pytest.raises(ValueError):
+            layer.mode = 'not_a_mode'
+    finally:
+        layer.mode = 'pan_zoom'
 
 
-def test_name():
+def test_name(shared_layer, random_points_2d_10):
     """Test setting layer name."""
-    np.random.seed(0)
-    data = 20 * np.random.random((10, 2))
-    layer = Points(data)
-    assert layer.name == 'Points'
+    assert shared_layer.name == 'Points'
 
-    layer = Points(data, name='random')
+    layer = Points(random_points_2d_10, name='random')
     assert layer.name == 'random'
 
     layer.name = 'pts'
     assert layer.name == 'pts'
 
 
-def test_visiblity():
+def test_visiblity(shared_layer, random_points_2d_10):
     """Test setting layer visiblity."""
-    np.random.seed(0)
-    data = 20 * np.random.random((10, 2))
-    layer = Points(data)
+    layer = shared_layer
     assert layer.visible is True
 
-    layer.visible = False
-    assert layer.visible is False
+    try:
+        layer.visible = False
+        assert layer.visible is False
+    finally:
+        layer.visible = True
 
-    layer = Points(data, visible=False)
+    layer = Points(random_points_2d_10, visible=False)
     assert layer.visible is False
 
     layer.visible = True
     assert layer.visible is True
 
 
-def test_opacity():
+def test_opacity(shared_layer, random_points_2d_10):
     """Test setting layer opacity."""
-    np.random.seed(0)
-    data = 20 * np.random.random((10, 2))
-    layer = Points(data)
+    layer = shared_layer
     assert layer.opacity == 1.0
 
-    layer.opacity = 0.5
-    assert layer.opacity == 0.5
+    try:
+        layer.opacity = 0.5
+        assert layer.opacity == 0.5
+    finally:
+        layer.opacity = 1.0
 
-    layer = Points(data, opacity=0.6)
+    layer = Points(random_points_2d_10, opacity=0.6)
     assert layer.opacity == 0.6
 
     layer.opacity = 0.3
     assert layer.opacity == 0.3
 
 
-def test_blending():
+def test_blending(shared_layer, random_points_2d_10):
     """Test setting layer blending."""
-    np.random.seed(0)
-    data = 20 * np.random.random((10, 2))
-    layer = Points(data)
+    layer = shared_layer
     assert layer.blending == 'translucent'
 
-    layer.blending = 'additive'
-    assert layer.blending == 'additive'
+    try:
+        layer.blending = 'additive'
+        assert layer.blending == 'additive'
+    finally:
+        layer.blending = 'translucent'
 
-    layer = Points(data, blending='additive')
+    layer = Points(random_points_2d_10, blending='additive')
     assert layer.blending == 'additive'
 
     layer.blending = 'opaque'
     assert layer.blending == 'opaque'
 
 
-def test_symbol():
+def test_symbol(shared_layer, random_points_2d_10):
     """Test setting symbol."""
-    shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    layer = Points(data)
+    layer = shared_layer
     assert layer.symbol == 'disc'
 
-    layer.symbol = 'cross'
-    assert layer.symbol == 'cross'
+    try:
+        layer.symbol = 'cross'
+        assert layer.symbol == 'cross'
+    finally:
+        layer.symbol = 'disc'
 
-    layer = Points(data, symbol='star')
+    layer = Points(random_points_2d_10, symbol='star')
     assert layer.symbol == 'star'
 
 
@@ -431,21 +496,40 @@ properties_array = {'point_type': _make_cycled_properties(['A', 'B'], 10)}
 properties_list = {'point_type': list(_make_cycled_properties(['A', 'B'], 10))}
 
 
-@pytest.mark.parametrize("properties", [properties_array, properties_list])
-def test_properties(properties):
+@pytest.fixture
+def properties_layer(request, random_points_2d_10):
+    """Layer built from the properties given by indirect parametrization."""
+    properties = request.param
+    layer = Points(random_points_2d_10, properties=properties.copy())
+    return layer, properties
+
+
+@pytest.mark.parametrize(
+    "properties_layer",
+    [properties_array, properties_list],
+    ids=['array', 'list'],
+    indirect=True,
+)
+def test_properties(properties_layer):
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    layer = Points(data, properties=copy(properties))
+    layer, properties = properties_layer
     np.testing.assert_equal(layer.properties, properties)
 
     current_prop = {'point_type': np.array(['B'])}
     assert layer.current_properties == current_prop
 
+    # expected point types after removing the first two points, adding a
+    # point and then pasting two more
+    point_types = np.asarray(properties['point_type'])
+    expected_annotations = np.empty(shape[0] + 1, dtype=point_types.dtype)
+    expected_annotations[: shape[0] - 2] = point_types[2:]
+    expected_annotations[shape[0] - 2] = 'A'
+    expected_annotations[shape[0] - 1 :] = ['A', 'B']
+
     # test removing points
     layer.selected_data = {0, 1}
     layer.remove_selected()
-    remove_properties = properties['point_type'][2::]
+    remove_properties = expected_annotations[: shape[0] - 2]
     assert len(layer.properties['point_type']) == (shape[0] - 2)
     assert np.all(layer.properties['point_type'] == remove_properties)
 
@@ -457,7 +541,7 @@ def test_properties(properties):
 
     # test adding points with properties
     layer.add([10, 10])
-    add_annotations = np.concatenate((remove_properties, ['A']), axis=0)
+    add_annotations = expected_annotations[: shape[0] - 1]
     assert np.all(layer.properties['point_type'] == add_annotations)
 
     # test copy/paste
@@ -466,17 +550,13 @@ def test_properties(properties):
     assert np.all(layer._clipboard['properties']['point_type'] == ['A', 'B'])
 
     layer._paste_data()
-    paste_annotations = np.concatenate((add_annotations, ['A', 'B']), axis=0)
-    assert np.all(layer.properties['point_type'] == paste_annotations)
+    assert np.all(layer.properties['point_type'] == expected_annotations)
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-def test_adding_properties(attribute):
+def test_adding_properties(attribute, make_points_layer):
     """Test adding properties to an existing layer"""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    layer = Points(data)
+    layer = make_points_layer()
 
     # add properties
     properties = {'point_type': _make_cycled_properties(['A', 'B'], shape[0])}
@@ -504,27 +584,26 @@ def test_adding_properties(attribute):
         layer.properties = properties_2
 
 
-def test_properties_dataframe():
+def test_properties_dataframe(random_points_2d_10):
     """Test if properties can be provided as a DataFrame"""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_2d_10
     properties = {'point_type': _make_cycled_properties(['A', 'B'], shape[0])}
     properties_df = pd.DataFrame(properties)
     properties_df = properties_df.astype(properties['point_type'].dtype)
     layer = Points(data, properties=properties_df)
     np.testing.assert_equal(layer.properties, properties)
+    assert layer.properties['point_type'].flags['C_CONTIGUOUS']
 
 
-def test_add_points_with_properties_as_list():
+def test_add_points_with_properties_as_list(random_points_2d_10):
     # test adding points initialized with properties as list
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_2d_10
     properties = {
         'point_type': list(_make_cycled_properties(['A', 'B'], shape[0]))
     }
-    layer = Points(data, properties=copy(properties))
+    layer = Points(data, properties=properties.copy())
 
     coord = [18, 18]
     layer.add(coord)
@@ -532,13 +611,14 @@ def test_add_points_with_properties_as_list():
     np.testing.assert_equal(layer.properties, new_prop)
 
 
-def test_updating_points_properties():
+def test_updating_points_properties(random_points_2d_10):
     # test adding points initialized with properties
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    properties = {'point_type': _make_cycled_properties(['A', 'B'], shape[0])}
-    layer = Points(data, properties=copy(properties))
+    data = random_points_2d_10
+    properties = {
+        'point_type': _make_cycled_properties(['A', 'B'], shape[0]).copy()
+    }
+    layer = Points(data, properties=properties.copy())
 
     layer.mode = 'select'
     layer.selected_data = [len(data) - 1]
@@ -557,13 +637,12 @@ def test_points_errors():
     # try adding properties with the wrong number of properties
     with pytest.raises(ValueError):
         annotations = {'point_type': np.array(['A', 'B'])}
-        Points(data, properties=copy(annotations))
+        Points(data, properties=annotations.copy())
 
 
-def test_is_color_mapped():
+def test_is_color_mapped(random_points_2d_10):
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    data = random_points_2d_10
     annotations = {'point_type': _make_cycled_properties(['A', 'B'], shape[0])}
     layer = Points(data, properties=annotations)
 
@@ -581,37 +660,36 @@ def test_is_color_mapped():
         layer._is_color_mapped((123, 323))
 
 
-def test_edge_width():
+def test_edge_width(shared_layer, random_points_2d_10):
     """Test setting edge width."""
-    shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    layer = Points(data)
+    layer = shared_layer
     assert layer.edge_width == 1
 
-    layer.edge_width = 2
-    assert layer.edge_width == 2
+    try:
+        layer.edge_width = 2
+        assert layer.edge_width == 2
+    finally:
+        layer.edge_width = 1
 
-    layer = Points(data, edge_width=3)
+    layer = Points(random_points_2d_10, edge_width=3)
     assert layer.edge_width == 3
 
 
-def test_n_dimensional():
+def test_n_dimensional(shared_layer, random_points_2d_10, random_points_4d_10):
     """Test setting n_dimensional flag for 2D and 4D data."""
-    shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    layer = Points(data)
+    layer = shared_layer
     assert layer.n_dimensional is False
 
-    layer.n_dimensional = True
-    assert layer.n_dimensional is True
+    try:
+        layer.n_dimensional = True
+        assert layer.n_dimensional is True
+    finally:
+        layer.n_dimensional = False
 
-    layer = Points(data, n_dimensional=True)
+    layer = Points(random_points_2d_10, n_dimensional=True)
     assert layer.n_dimensional is True
 
-    shape = (10, 4)
-    data = 20 * np.random.random(shape)
+    data = random_points_4d_10
     layer = Points(data)
     assert layer.n_dimensional is False
 
@@ -622,14 +700,11 @@ def test_n_dimensional():
     assert layer.n_dimensional is True
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-def test_switch_color_mode(attribute):
+def test_switch_color_mode(attribute, make_points_layer):
     """Test switching between color modes"""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
     # create a continuous property with a known value in the last element
-    continuous_prop = np.random.random((shape[0],))
+    continuous_prop = np.random.default_rng(0).random(shape[0])
     continuous_prop[-1] = 1
     properties = {
         'point_truthiness': continuous_prop,
@@ -645,7 +720,7 @@ def test_switch_color_mode(attribute):
         colormap_kwarg: 'gray',
         color_cycle_kwarg: color_cycle,
     }
-    layer = Points(data, properties=properties, **args)
+    layer = make_points_layer(properties=properties, **args)
 
     layer_color_mode = getattr(layer, f'{attribute}_color_mode')
     layer_color = getattr(layer, f'{attribute}_color')
@@ -672,7 +747,7 @@ def test_switch_color_mode(attribute):
     setattr(layer, f'{attribute}_color_mode', 'cycle')
     setattr(layer, f'{attribute}_color', 'point_type')
     color = getattr(layer, f'{attribute}_color')
-    layer_color = transform_color(color_cycle * int((shape[0] / 2)))
+    layer_color = _transform_color(color_cycle * int((shape[0] / 2)))
     np.testing.assert_allclose(color, layer_color)
 
     # switch back to direct, edge_colors shouldn't change
@@ -681,68 +756,61 @@ def test_switch_color_mode(attribute):
     np.testing.assert_allclose(new_edge_color, color)
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-def test_colormap_without_properties(attribute):
+def test_colormap_without_properties(make_points_layer):
     """Setting the colormode to colormap should raise an exception"""
-    shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    layer = Points(data)
+    layer = make_points_layer()
 
-    with pytest.raises(ValueError):
-        setattr(layer, f'{attribute}_color_mode', 'colormap')
+    for attribute in ['edge', 'face']:
+        with pytest.raises(ValueError):
+            setattr(layer, f'{attribute}_color_mode', 'colormap')
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-def test_colormap_with_categorical_properties(attribute):
+def test_colormap_with_categorical_properties(make_points_layer):
     """Setting the colormode to colormap should raise an exception"""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
     properties = {'point_type': _make_cycled_properties(['A', 'B'], shape[0])}
-    layer = Points(data, properties=properties)
+    layer = make_points_layer(properties=properties)
 
-    with pytest.raises(TypeError):
-        setattr(layer, f'{attribute}_color_mode', 'colormap')
+    for attribute in ['edge', 'face']:
+        with pytest.raises(TypeError):
+            setattr(layer, f'{attribute}_color_mode', 'colormap')
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-def test_add_colormap(attribute):
+def test_add_colormap(make_points_layer):
     """Test  directly adding a vispy Colormap object"""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
     annotations = {'point_type': _make_cycled_properties([0, 1.5], shape[0])}
-    color_kwarg = f'{attribute}_color'
-    colormap_kwarg = f'{attribute}_colormap'
-    args = {color_kwarg: 'point_type', colormap_kwarg: 'viridis'}
-    layer = Points(data, properties=annotations, **args)
+    args = {}
+    for attribute in ['edge', 'face']:
+        args[f'{attribute}_color'] = 'point_type'
+        args[f'{attribute}_colormap'] = 'viridis'
+    layer = make_points_layer(properties=annotations, **args)
 
-    setattr(layer, f'{attribute}_colormap', get_colormap('gray'))
-    layer_colormap = getattr(layer, f'{attribute}_colormap')
-    assert layer_colormap[0] == 'unknown_colormap'
+    for attribute in ['edge', 'face']:
+        setattr(layer, f'{attribute}_colormap', get_colormap('gray'))
+        layer_colormap = getattr(layer, f'{attribute}_colormap')
+        assert layer_colormap[0] == 'unknown_colormap'
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-def test_color_direct(attribute: str):
+def test_color_direct(attribute: str, make_points_layer):
     """Test setting colors directly"""
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
     layer_kwargs = {f'{attribute}_color': 'black'}
-    layer = Points(data, **layer_kwargs)
-    color_array = transform_color(['black'] * shape[0])
+    layer = make_points_layer(**layer_kwargs)
+    # leave room for the point added below
+    color_array = np.empty((shape[0] + 1, 4))
+    color_array[: shape[0]] = _transform_color(['black'] * shape[0])
     current_color = getattr(layer, f'current_{attribute}_color')
     layer_color = getattr(layer, f'{attribute}_color')
     assert current_color == 'black'
     assert len(layer.edge_color) == shape[0]
-    np.testing.assert_allclose(color_array, layer_color)
+    np.testing.assert_allclose(color_array[: shape[0]], layer_color)
 
     # With no data selected changing color has no effect
     setattr(layer, f'current_{attribute}_color', 'blue')
     current_color = getattr(layer, f'current_{attribute}_color')
     assert current_color == 'blue'
-    np.testing.assert_allclose(color_array, layer_color)
+    np.testing.assert_allclose(color_array[: shape[0]], layer_color)
 
     # Select data and change edge color of selection
     selected_data = {0, 1}
@@ -750,17 +818,17 @@ def test_color_direct(attribute: str):
     current_color = getattr(layer, f'current_{attribute}_color')
     assert current_color == 'black'
     setattr(layer, f'current_{attribute}_color', 'green')
-    colorarray_green = transform_color(['green'] * len(layer.selected_data))
+    colorarray_green = _transform_color(['green'] * len(layer.selected_data))
     color_array[list(selected_data)] = colorarray_green
     layer_color = getattr(layer, f'{attribute}_color')
-    np.testing.assert_allclose(color_array, layer_color)
+    np.testing.assert_allclose(color_array[: shape[0]], layer_color)
 
     # Add new point and test its color
     coord = [18, 18]
     layer.selected_data = {}
     setattr(layer, f'current_{attribute}_color', 'blue')
     layer.add(coord)
-    color_array = np.vstack([color_array, transform_color('blue')])
+    color_array[shape[0]] = _transform_color('blue')
     layer_color = getattr(layer, f'{attribute}_color')
     assert len(layer_color) == shape[0] + 1
     np.testing.assert_allclose(color_array, layer_color)
@@ -773,7 +841,7 @@ def test_color_direct(attribute: str):
     layer_color = getattr(layer, f'{attribute}_color')
     assert len(layer_color) == shape[0] - 1
     np.testing.assert_allclose(
-        layer_color, np.vstack((color_array[1], color_array[3:])),
+        layer_color, np.delete(color_array, [0, 2], axis=0)
     )
 
 
@@ -782,26 +850,37 @@ color_cycle_rgb = [[1, 0, 0], [0, 0, 1]]
 color_cycle_rgba = [[1, 0, 0, 1], [0, 0, 1, 1]]
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-@pytest.mark.parametrize(
-    "color_cycle", [color_cycle_str, color_cycle_rgb, color_cycle_rgba],
-)
-def test_color_cycle(attribute, color_cycle):
+@pytest.mark.parametrize("color_cycle", [color_cycle_rgb, color_cycle_rgba])
+def test_color_cycle_forms_equivalent(color_cycle):
+    """Test that RGB and RGBA color cycles match the named color cycle
+
+    Every color cycle form goes through the same conversion, so the layer
+    behaviour only needs to be tested with one of them in test_color_cycle.
+    """
+    _, expected_colors = transform_color_cycle(
+        color_cycle_str, elem_name='face_color_cycle', default='white'
+    )
+    _, colors = transform_color_cycle(
+        color_cycle, elem_name='face_color_cycle', default='white'
+    )
+    np.testing.assert_allclose(colors, expected_colors)
+
+
+def test_color_cycle(attribute, make_points_layer):
     """Test setting edge/face color with a color cycle list"""
     # create Points using list color cycle
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
+    color_cycle = color_cycle_str
     properties = {'point_type': _make_cycled_properties(['A', 'B'], shape[0])}
     points_kwargs = {
         'properties': properties,
         f'{attribute}_color': 'point_type',
         f'{attribute}_color_cycle': color_cycle,
     }
-    layer = Points(data, **points_kwargs)
+    layer = make_points_layer(**points_kwargs)
 
     assert layer.properties == properties
-    color_array = transform_color(
+    color_array = _transform_color(
         list(islice(cycle(color_cycle), 0, shape[0]))
     )
     layer_color = getattr(layer, f'{attribute}_color')
@@ -814,7 +893,7 @@ def test_color_cycle(attribute, color_cycle):
     layer_color = getattr(layer, f'{attribute}_color')
     assert len(layer_color) == shape[0] + 1
     np.testing.assert_allclose(
-        layer_color, np.vstack((color_array, transform_color('red'))),
+        layer_color, np.vstack((color_array, _transform_color('red'))),
     )
 
     # Check removing data adjusts colors correctly
@@ -826,14 +905,15 @@ def test_color_cycle(attribute, color_cycle):
     assert len(layer_color) == shape[0] - 1
     np.testing.assert_allclose(
         layer_color,
-        np.vstack((color_array[1], color_array[3:], transform_color('red'))),
+        np.vstack((color_array[1], color_array[3:], _transform_color('red'))),
     )
 
     # refresh colors
     layer.refresh_colors(update_color_mapping=True)
+    layer_color = getattr(layer, f'{attribute}_color')
+    assert layer_color.shape == (shape[0] - 1, 4)
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
 def test_add_color_cycle_to_empty_layer(attribute):
     """ Test adding a point to an empty layer when edge/face color is a color cycle
 
@@ -849,7 +929,7 @@ def test_add_color_cycle_to_empty_layer(attribute):
     layer = Points(**points_kwargs)
 
     # verify the current_edge_color is correct
-    expected_color = transform_color(color_cycle[0])
+    expected_color = _transform_color(color_cycle[0])
     current_color = getattr(layer, f'_current_{attribute}_color')
     np.testing.assert_allclose(current_color, expected_color)
 
@@ -873,8 +953,7 @@ def test_add_color_cycle_to_empty_layer(attribute):
     np.testing.assert_equal(layer.properties, new_properties)
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-def test_adding_value_color_cycle(attribute):
+def test_adding_value_color_cycle(attribute, make_points_layer):
     """ Test that adding values to properties used to set a color cycle
     and then calling Points.refresh_colors() performs the update and adds the
     new value to the face/edge_color_cycle_map.
@@ -882,16 +961,16 @@ def test_adding_value_color_cycle(attribute):
     See: https://github.com/napari/napari/issues/988
     """
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
-    properties = {'point_type': _make_cycled_properties(['A', 'B'], shape[0])}
+    properties = {
+        'point_type': _make_cycled_properties(['A', 'B'], shape[0]).copy()
+    }
     color_cycle = ['red', 'blue']
     points_kwargs = {
         'properties': properties,
         f'{attribute}_color': 'point_type',
         f'{attribute}_color_cycle': color_cycle,
     }
-    layer = Points(data, **points_kwargs)
+    layer = make_points_layer(**points_kwargs)
 
     # make point 0 point_type C
     point_types = layer.properties['point_type']
@@ -904,24 +983,21 @@ def test_adding_value_color_cycle(attribute):
     assert 'C' in color_map_keys
 
 
-@pytest.mark.parametrize("attribute", ['edge', 'face'])
-def test_color_colormap(attribute):
+def test_color_colormap(attribute, make_points_layer):
     """Test setting edge/face color with a colormap"""
     # create Points using with a colormap
     shape = (10, 2)
-    np.random.seed(0)
-    data = 20 * np.random.random(shape)
     properties = {'point_type': _make_cycled_properties([0, 1.5], shape[0])}
     points_kwargs = {
         'properties': properties,
         f'{attribute}_color': 'point_type',
         f'{attribute}_colormap': 'gray',
     }
-    layer = Points(data, **points_kwargs)
+    layer = make_points_layer(**points_kwargs)
     assert layer.properties == properties
     color_mode = getattr(layer, f'{attribute}_color_mode')
     assert color_mode == 'colormap'
-    color_array = transform_color(['black', 'white'] * int((shape[0] / 2)))
+    color_array = _transform_color(['black', 'white'] * int((shape[0] / 2)))
     attribute_color = getattr(layer, f'{attribute}_color')
     assert np.all(attribute_color == color_array)
 
@@ -937,7 +1013,7 @@ def test_color_colormap(attribute):
     attribute_color = getattr(layer, f'{attribute}_color')
     assert len(attribute_color) == shape[0] + 1
     np.testing.assert_allclose(
-        attribute_color, np.vstack((color_array, transform_color('black'))),
+        attribute_color, np.vstack((color_array, _transform_color('black'))),
     )
 
     # Check removing data adjusts colors correctly
@@ -949,7 +1025,7 @@ def test_color_colormap(attribute):
     np.testing.assert_allclose(
         attribute_color,
         np.vstack(
-            (color_array[1], color_array[3:], transform_color('black'),)
+            (color_array[1], color_array[3:], _transform_color('black'),)
         ),
     )
 
@@ -1243,6 +1319,25 @@ def test_thumbnail_with_n_points_greater_than_max():
     assert bigger_layer_3d.thumbnail.shape == bigger_layer_3d._thumbnail_shape
 
 
+def test_thumbnail_colors_with_n_points_greater_than_max():
+    """Test subsampled thumbnail colors when only some points are in view"""
+    n_points = Points._max_points_thumbnail * 4
+    coords = np.random.randint(10, 100, (n_points, 2))
+    # the first half of the points is out of the slice and blue, the second
+    # half is in the slice and red, so view and data indices differ
+    plane = np.repeat([[1], [0]], n_points // 2, axis=0)
+    data = np.concatenate((plane, coords), axis=1)
+    face_color = np.repeat([[0, 0, 1, 1], [1, 0, 0, 1]], n_points // 2, axis=0)
+    layer = Points(data, face_color=face_color)
+    layer.dims.set_point(0, 0)
+    assert len(layer._indices_view) > layer._max_points_thumbnail
+
+    layer._update_thumbnail()
+    thumbnail = layer.thumbnail
+    assert np.any(thumbnail[..., 0] == 255)
+    assert np.all(thumbnail[..., 2] == 0)
+
+
 def test_xml_list():
     """Test the xml generation."""
     shape = (10, 2)
@@ -1273,6 +1368,33 @@ def test_view_data():
     assert np.all(layer._view_data == coords)
 
 
+def test_view_data_transposed():
+    """Test view data with non-contiguous displayed axes."""
+    coords = np.array([[0, 1, 1], [1, 2, 2], [0, 3, 3], [3, 3, 3]])
+    layer = Points(coords)
+
+    layer.dims.order = [1, 0, 2]
+    assert layer.dims.displayed == [0, 2]
+    layer.dims.set_point(1, 3)
+    assert np.all(layer._view_data == coords[np.ix_([2, 3], [0, 2])])
+
+
+def test_selected_view():
+    """Test that selected points are mapped to their position in view."""
+    coords = np.array([[0, 1, 1], [1, 2, 2], [0, 3, 3], [0, 4, 4]])
+    layer = Points(coords)
+
+    layer.dims.set_point(0, 0)
+    layer.selected_data = {1, 3}
+    assert layer._selected_view == [2]
+
+    layer.dims.set_point(0, 1)
+    assert layer._selected_view == [0]
+
+    layer.selected_data = {0}
+    assert layer._selected_view == []
+
+
 def test_view_size():
     coords = np.array([[0, 1, 1], [0, 2, 2], [1, 3, 3], [3, 3, 3]])
     sizes = np.array([[3, 5, 5], [3, 5, 5], [3, 3, 3], [2, 2, 3]])
@@ -1336,4 +1458,13 @@ def test_interaction_box():
     index = [0]
     expected_box = points_to_squares(data, size)
     box = layer.interaction_box(index)
-    np.all([np.isin(p, expected_box) for p in box])
+    assert np.all([np.isin(p, expected_box) for p in box])
+
+    # the box around several points spans the squares of all of them
+    data = [[3, 3], [10, 4], [6, 12]]
+    sizes = [2, 4, 6]
+    layer = Points(data, size=sizes)
+    index = [0, 1, 2]
+    expected_box = create_box(points_to_squares(data, sizes))
+    box = layer.interaction_box(index)
+    np.testing.assert_allclose(box, expected_box)
@@ -25,11 +25,9 @@ from ..utils.color_transformations import (
 )
 from ._points_constants import Symbol, SYMBOL_ALIAS, Mode, ColorMode
 from ._points_mouse_bindings import add, select, highlight
-from ._points_utils import (
-    create_box,
-    points_to_squares,
-)
+from ._points_utils import create_box
 from ..utils.layer_utils import (
+    convert_to_uint8,
     dataframe_to_properties,
     guess_continuous,
     map_property,
@@ -477,7 +475,10 @@ class Points(Layer):
                 # add new face colors
                 self._add_point_color(adding, 'face')
 
-                self.size = np.concatenate((self._size, size), axis=0)
+                # the concatenated sizes already have the data shape, so skip
+                # the broadcast copy and refresh of the size setter; the view
+                # is refreshed once by _update_dims below
+                self._size = np.concatenate((self._size, size), axis=0)
                 self.selected_data = set(np.arange(cur_npoints, len(data)))
 
         self._update_dims()
@@ -670,8 +671,8 @@ class Points(Layer):
             and len(self.selected_data) > 0
             and self._mode != Mode.ADD
         ):
-            for i in self.selected_data:
-                self.size[i, :] = (self.size[i, :] > 0) * size
+            index = list(self.selected_data)
+            self.size[index] = (self.size[index] > 0) * size
             self.refresh()
             self.events.size()
         self.status = format_float(self.current_size)
@@ -1051,10 +1052,15 @@ class Points(Layer):
                             f'{attribute}_color_cycle_map',
                             color_cycle_map,
                         )
-                colors = np.array(
-                    [color_cycle_map[x] for x in color_properties]
-                )
-                if len(colors) == 0:
+                if len(color_properties) > 0:
+                    # look up each unique property value once and gather the
+                    # per-point colors from the resulting table
+                    values, inverse = np.unique(
+                        color_properties, return_inverse=True
+                    )
+                    color_lut = np.vstack([color_cycle_map[x] for x in values])
+                    colors = color_lut[inverse]
+                else:
                     colors = np.empty((0, 4))
                 setattr(self, f'_{attribute}_color', colors)
 
@@ -1141,12 +1147,7 @@ class Points(Layer):
     @selected_data.setter
     def selected_data(self, selected_data):
         self._selected_data = set(selected_data)
-        selected = []
-        for c in self._selected_data:
-            if c in self._indices_view:
-                ind = list(self._indices_view).index(c)
-                selected.append(ind)
-        self._selected_view = selected
+        self._selected_view = self._get_selected_view()
 
         # Update properties based on selected points
         if len(self._selected_data) == 0:
@@ -1165,13 +1166,10 @@ class Points(Layer):
             with self.block_update_properties():
                 self.current_face_color = face_color
 
-        size = list(
-            set([self.size[i, self.dims.displayed].mean() for i in index])
-        )
-        if len(size) == 1:
-            size = size[0]
+        sizes = self.size[np.ix_(index, self.dims.displayed)].mean(axis=1)
+        if np.all(sizes == sizes[0]):
             with self.block_update_properties():
-                self.current_size = size
+                self.current_size = sizes[0]
 
         properties = {
             k: np.unique(v[index], axis=0) for k, v in self.properties.items()
@@ -1200,9 +1198,13 @@ class Points(Layer):
             box = None
         else:
             data = self._view_data[index]
-            size = self._view_size[index]
-            data = points_to_squares(data, size)
-            box = create_box(data)
+            half_size = np.sqrt(2) / 2 * self._view_size[index, np.newaxis]
+            # The box around the squares of all points only depends on the
+            # extreme corners, so skip materialising all 4N vertices
+            min_corner = (data - half_size).min(axis=0)
+            max_corner = (data + half_size).max(axis=0)
+            extremes = np.stack([min_corner, max_corner])
+            box = create_box(extremes)
 
         return box
 
@@ -1269,6 +1271,30 @@ class Points(Layer):
 
         self.events.mode(mode=mode)
 
+    def _take_view(self, array: np.ndarray) -> np.ndarray:
+        """Gather the displayed axes of the points in view from an array.
+
+        A contiguous run of displayed axes is selected with a slice, so that
+        the gather needs a single fancy index over the points in view instead
+        of an ``np.ix_`` mesh.
+
+        Parameters
+        ----------
+        array : (N, D) np.ndarray
+            Per point array with one column per data dimension, such as
+            the layer `data` or `size`.
+
+        Returns
+        -------
+        view : (M, ndisplay) np.ndarray
+            Rows of the M points in view restricted to the displayed axes.
+        """
+        displayed = list(self.dims.displayed)
+        start = displayed[0]
+        if displayed == list(range(start, start + len(displayed))):
+            return array[self._indices_view, start : start + len(displayed)]
+        return array[np.ix_(self._indices_view, displayed)]
+
     @property
     def _view_data(self) -> np.ndarray:
         """Get the coords of the points in view
@@ -1279,8 +1305,7 @@ class Points(Layer):
             Array of coordinates for the N points in view
         """
         if len(self._indices_view) > 0:
-
-            data = self.data[np.ix_(self._indices_view, self.dims.displayed)]
+            data = self._take_view(self.data)
 
         else:
             # if no points in this slice send dummy data
@@ -1300,10 +1325,7 @@ class Points(Layer):
         if len(self._indices_view) > 0:
             # Get the point sizes and scale for ndim display
             sizes = (
-                self.size[
-                    np.ix_(self._indices_view, self.dims.displayed)
-                ].mean(axis=1)
-                * self._view_size_scale
+                self._take_view(self.size).mean(axis=1) * self._view_size_scale
             )
 
         else:
@@ -1378,12 +1400,15 @@ class Points(Layer):
                 scale_per_dim = (size_match - distances[matches]) / size_match
                 scale_per_dim[size_match == 0] = 1
                 scale = np.prod(scale_per_dim, axis=1)
-                slice_indices = np.where(matches)[0].astype(int)
+                slice_indices = np.flatnonzero(matches)
                 return slice_indices, scale
             else:
-                data = self.data[:, not_disp].astype('int')
-                matches = np.all(data == indices[not_disp], axis=1)
-                slice_indices = np.where(matches)[0].astype(int)
+                # Build the mask one non-displayed axis at a time, which
+                # avoids gathering and casting an (N, D - ndisplay) block
+                matches = np.ones(len(self.data), dtype=bool)
+                for axis in not_disp:
+                    matches &= self.data[:, axis].astype(int) == indices[axis]
+                slice_indices = np.flatnonzero(matches)
                 return slice_indices, 1
         else:
             return [], []
@@ -1397,9 +1422,10 @@ class Points(Layer):
             Index of point that is at the current coordinate if any.
         """
         # Display points if there are any in this slice
-        if len(self._view_data) > 0:
+        view_data = self._view_data
+        if len(view_data) > 0:
             # Get the point sizes
-            distances = abs(self._view_data - self.displayed_coordinates)
+            distances = abs(view_data - self.displayed_coordinates)
             in_slice_matches = np.all(
                 distances <= np.expand_dims(self._view_size, axis=1) / 2,
                 axis=1,
@@ -1414,6 +1440,20 @@ class Points(Layer):
 
         return selection
 
+    def _get_selected_view(self) -> List[int]:
+        """Get the positions of the selected points within the current view.
+
+        Returns
+        ----------
+        selected_view : list
+            Integer indices into the `_view_data` array of the selected
+            points that are in the currently viewed slice.
+        """
+        if len(self._selected_data) == 0:
+            return []
+        in_view = np.isin(self._indices_view, list(self._selected_data))
+        return np.flatnonzero(in_view).tolist()
+
     def _set_view_slice(self):
         """Sets the view given the indices to slice with."""
         # get the indices of points in view
@@ -1421,12 +1461,7 @@ class Points(Layer):
         self._view_size_scale = scale
         self._indices_view = indices
         # get the selected points that are in view
-        selected = []
-        for c in self.selected_data:
-            if c in self._indices_view:
-                ind = list(self._indices_view).index(c)
-                selected.append(ind)
-        self._selected_view = selected
+        self._selected_view = self._get_selected_view()
         with self.events.highlight.blocker():
             self._set_highlight(force=True)
 
@@ -1503,9 +1538,12 @@ class Points(Layer):
 
     def _update_thumbnail(self):
         """Update thumbnail with current points and colors."""
-        colormapped = np.zeros(self._thumbnail_shape)
-        colormapped[..., 3] = 1
-        if len(self._view_data) > 0:
+        # The thumbnail is rendered directly as uint8 so that the colors of
+        # the sampled points are quantised once instead of the whole image
+        colormapped = np.zeros(self._thumbnail_shape, dtype=np.uint8)
+        colormapped[..., 3] = np.rint(255 * self.opacity)
+        view_data = self._view_data
+        if len(view_data) > 0:
             min_vals = [self.dims.range[i][0] for i in self.dims.displayed]
             shape = np.ceil(
                 [
@@ -1516,13 +1554,14 @@ class Points(Layer):
             zoom_factor = np.divide(
                 self._thumbnail_shape[:2], shape[-2:]
             ).min()
-            if len(self._view_data) > self._max_points_thumbnail:
-                thumbnail_indices = np.random.randint(
-                    0, len(self._view_data), self._max_points_thumbnail
+            if len(view_data) > self._max_points_thumbnail:
+                view_indices = np.random.randint(
+                    0, len(view_data), self._max_points_thumbnail
                 )
-                points = self._view_data[thumbnail_indices]
+                points = view_data[view_indices]
+                thumbnail_indices = self._indices_view[view_indices]
             else:
-                points = self._view_data
+                points = view_data
                 thumbnail_indices = self._indices_view
             coords = np.floor(
                 (points[:, -2:] - min_vals[-2:] + 0.5) * zoom_factor
@@ -1531,9 +1570,9 @@ class Points(Layer):
                 coords, 0, np.subtract(self._thumbnail_shape[:2], 1)
             )
             colors = self.face_color[thumbnail_indices]
-            colormapped[coords[:, 0], coords[:, 1]] = colors
+            colors[:, 3] *= self.opacity
+            colormapped[coords[:, 0], coords[:, 1]] = convert_to_uint8(colors)
 
-        colormapped[..., 3] *= self.opacity
         self.thumbnail = colormapped
 
     def add(self, coord):
@@ -1541,7 +1580,9 @@ class Points(Layer):
 
         Parameters
         ----------
-        coord : sequence of indices to add point at
+        coord : sequence of indices to add point at, or (M, D) array
+            Coordinates of the point to add. An (M, D) array adds all M
+            points at once.
         """
         self.data = np.append(self.data, np.atleast_2d(coord), axis=0)
 
@@ -1575,44 +1616,37 @@ class Points(Layer):
         if len(index) > 0:
             index = list(index)
             disp = list(self.dims.displayed)
+            moving = np.ix_(index, disp)
+            points = self.data[moving]
+            center = points.mean(axis=0)
             if self._drag_start is None:
-                center = self.data[np.ix_(index, disp)].mean(axis=0)
                 self._drag_start = np.array(coord)[disp] - center
-            center = self.data[np.ix_(index, disp)].mean(axis=0)
             shift = np.array(coord)[disp] - center - self._drag_start
-            self.data[np.ix_(index, disp)] = (
-                self.data[np.ix_(index, disp)] + shift
-            )
+            self.data[moving] = points + shift
             self.refresh()
 
     def _paste_data(self):
         """Paste any point from clipboard and select them."""
-        npoints = len(self._view_data)
+        npoints = len(self._indices_view)
         totpoints = len(self.data)
 
         if len(self._clipboard.keys()) > 0:
             not_disp = self.dims.not_displayed
-            data = deepcopy(self._clipboard['data'])
+            data = self._clipboard['data'].copy()
             offset = [
                 self.dims.indices[i] - self._clipboard['indices'][i]
                 for i in not_disp
             ]
             data[:, not_disp] = data[:, not_disp] + np.array(offset)
             self._data = np.append(self.data, data, axis=0)
-            self._size = np.append(
-                self.size, deepcopy(self._clipboard['size']), axis=0
-            )
+            self._size = np.append(self.size, self._clipboard['size'], axis=0)
+            # clipboard colors were copied from the layer and are already
+            # RGBA arrays, so they can be stacked without being re-parsed
             self._edge_color = np.vstack(
-                (
-                    self.edge_color,
-                    transform_color(deepcopy(self._clipboard['edge_color'])),
-                )
+                (self.edge_color, self._clipboard['edge_color'])
             )
             self._face_color = np.vstack(
-                (
-                    self.face_color,
-                    transform_color(deepcopy(self._clipboard['face_color'])),
-                )
+                (self.face_color, self._clipboard['face_color'])
             )
             for k in self.properties:
                 self.properties[k] = np.concatenate(
@@ -1661,20 +1695,27 @@ class Points(Layer):
         opacity = str(self.opacity)
         props = {'stroke-width': width, 'opacity': opacity}
 
-        for i, d, s in zip(
-            self._indices_view, self._view_data, self._view_size
-        ):
-            d = d[::-1]
+        # Convert the coordinates, radii and colors of all points in view up
+        # front so that the loop only has to format them
+        view_data = self._view_data[:, ::-1]
+        radii = self._view_size / 2
+        face_colors = (255 * self._view_face_color[:, :3]).astype(int).tolist()
+        edge_colors = (255 * self._view_edge_color[:, :3]).astype(int).tolist()
+
+        for d, r, fc, ec in zip(view_data, radii, face_colors, edge_colors):
             cx = str(d[0])
             cy = str(d[1])
-            r = str(s / 2)
-            face_color = (255 * self.face_color[i]).astype(np.int)
-            fill = f'rgb{tuple(face_color[:3])}'
-            edge_color = (255 * self.edge_color[i]).astype(np.int)
-            stroke = f'rgb{tuple(edge_color[:3])}'
+            fill = f'rgb{tuple(fc)}'
+            stroke = f'rgb{tuple(ec)}'
 
             element = Element(
-                'circle', cx=cx, cy=cy, r=r, stroke=stroke, fill=fill, **props
+                'circle',
+                cx=cx,
+                cy=cy,
+                r=str(r),
+                stroke=stroke,
+                fill=fill,
+                **props,
             )
             xml_list.append(element)
 
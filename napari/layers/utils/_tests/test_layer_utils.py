@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 from dask import array as da
+from vispy.color import get_colormap
 
 from napari.layers.utils.layer_utils import (
     calc_data_range,
@@ -9,6 +10,7 @@ from napari.layers.utils.layer_utils import (
     segment_normal,
     dataframe_to_properties,
     guess_continuous,
+    map_property,
 )
 
 
@@ -114,6 +116,16 @@ def test_dataframe_to_properties():
     np.testing.assert_equal(converted_properties, properties)
 
 
+def test_dataframe_to_properties_contiguous():
+    # columns of a dataframe made from a 2D array are strided views
+    properties_df = pd.DataFrame(
+        np.random.random((10, 2)), columns=['prop_a', 'prop_b']
+    )
+    converted_properties = dataframe_to_properties(properties_df)
+    for prop in converted_properties.values():
+        assert prop.flags['C_CONTIGUOUS']
+
+
 def test_guess_continuous():
     continuous_annotation = np.array([1, 2, 3], dtype=np.float32)
     assert guess_continuous(continuous_annotation)
@@ -123,3 +135,11 @@ def test_guess_continuous():
 
     categorical_annotation_2 = np.array([1, 2, 3], dtype=np.int)
     assert not guess_continuous(categorical_annotation_2)
+
+
+def test_map_property():
+    prop = np.array([0, 1, 2, 4], dtype=float)
+    colors, contrast_limits = map_property(prop, get_colormap('viridis'))
+    assert contrast_limits == (0, 4)
+    assert colors.shape == (4, 4)
+    assert colors.dtype == np.float32
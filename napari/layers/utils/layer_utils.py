@@ -171,7 +171,9 @@ def dataframe_to_properties(dataframe) -> Dict[str, np.ndarray]:
         is an ndarray with the property value for each point.
     """
 
-    properties = {col: np.asarray(dataframe[col]) for col in dataframe}
+    properties = {
+        col: np.ascontiguousarray(dataframe[col]) for col in dataframe
+    }
     return properties
 
 
@@ -205,12 +207,22 @@ def map_property(
         If a 2-tuple is provided, it should be provided as (lower_bound, upper_bound).
         If None is provided, the contrast limits will be set to (property.min(), property.max()).
         Default value is None.
+
+    Returns
+    -------
+    mapped_properties : np.ndarray
+        (N, 4) array of RGBA colors with a dtype of np.float32, matching the
+        colors returned by ``transform_color``.
+    contrast_limits : Tuple[float, float]
+        The contrast limits used to normalize the property.
     """
 
     if contrast_limits is None:
         contrast_limits = (prop.min(), prop.max())
     normalized_properties = np.interp(prop, contrast_limits, (0, 1))
-    mapped_properties = colormap.map(normalized_properties)
+    mapped_properties = colormap.map(normalized_properties).astype(
+        np.float32, copy=False
+    )
 
     return mapped_properties, contrast_limits
 
@@ -8,6 +8,10 @@ from napari_plugins import napari_hook_implementation
 from ..types import ReaderFunction, image_reader_to_layerdata_reader
 from ..utils.io import magic_imread
 
+# The builtin reader never changes, so convert it once at import instead of
+# building a new wrapper on every napari_get_reader call
+_magic_imread_reader = image_reader_to_layerdata_reader(magic_imread)
+
 
 @napari_hook_implementation(trylast=True)
 def napari_get_reader(path: Union[str, List[str]]) -> ReaderFunction:
@@ -26,4 +30,4 @@ def napari_get_reader(path: Union[str, List[str]]) -> ReaderFunction:
     callable
         function that returns layer_data to be handed to viewer._add_layer_data
     """
-    return image_reader_to_layerdata_reader(magic_imread)
+    return _magic_imread_reader
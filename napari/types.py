@@ -1,20 +1,28 @@
 from functools import wraps
-from typing import Any, Callable, Dict, List, Tuple, Union, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Type,
+)
 from types import TracebackType
 
 import numpy as np
 import dask.array as da
 
-try:
-    import zarr
-except ImportError:
-    zarr = None
-
 # This is a WOEFULLY inadequate stub for a duck-array type.
 # Mostly, just a placeholder for the concept of needing an ArrayLike type.
 # Ultimately, this should come from https://github.com/napari/image-types
 # and should probably be replaced by a typing.Protocol
-if zarr:
+# zarr is only imported for type checkers, as importing it at runtime (and
+# numcodecs with it) is slow and not needed to use the alias.
+if TYPE_CHECKING:
+    import zarr
+
     ArrayLike = Union[np.ndarray, da.Array, zarr.Array]
 else:
     ArrayLike = Union[np.ndarray, da.Array]